@@ -1,11 +1,22 @@
-from PySide6.QtMultimedia import (QMediaPlayer, QMediaDevices, QAudioOutput)
+from PySide6.QtMultimedia import (QMediaPlayer, QMediaDevices, QAudioOutput, QAudioDevice)
 from PySide6.QtWidgets import QMessageBox
 from PySide6.QtCore import QUrl
-from typing import List
+from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass
+from operator import attrgetter
 import os
 from classes.SettingsManager import SettingsManager
 from classes.Config import Config
 
+FORMAT_RANKS = {ext: rank for rank, ext in enumerate(Config.SUPPORTED_FORMATS)}
+
+@dataclass
+class SoundEntry:
+    name: str
+    path: str
+    mtime: float
+    rank: int
+
 class AudioManager:
 
     def __init__(self, settings_manager: SettingsManager):
@@ -18,8 +29,14 @@ class AudioManager:
         self.virtual_cable_output = None
 
         self.current_input_device_name = ""
-        self._sound_list_cache = []
-        self._sound_list_cache_dir = None
+        self.volume = int(self.settings_manager.get("VolumeInput", 50))
+        self._url_cache: Dict[str, QUrl] = {}
+        self._path_index: Dict[str, str] = {}
+
+        self._audio_outputs: Optional[List[QAudioDevice]] = None
+        self._outputs_by_description: Dict[str, QAudioDevice] = {}
+        self.media_devices = QMediaDevices()
+        self.media_devices.audioOutputsChanged.connect(self.invalidate_audio_outputs)
 
     VIRTUAL_DEVICE_KEYWORDS = (
         "cable",
@@ -29,106 +46,141 @@ class AudioManager:
         "vac",
     )
 
+    def invalidate_audio_outputs(self) -> None:
+        self._audio_outputs = None
+        self._outputs_by_description = {}
+
+    def get_audio_outputs(self) -> List[QAudioDevice]:
+        if self._audio_outputs is None:
+            self._audio_outputs = QMediaDevices.audioOutputs()
+            self._outputs_by_description = {}
+            for dev in self._audio_outputs:
+                self._outputs_by_description.setdefault(dev.description(), dev)
+        return self._audio_outputs
+
+    def find_audio_output(self, description: str) -> Optional[QAudioDevice]:
+        self.get_audio_outputs()
+        return self._outputs_by_description.get(description)
+
     def get_audio_input_devices(self) -> List:
-        all_outputs = QMediaDevices.audioOutputs()
-        virtual_devices = [
+        all_outputs = self.get_audio_outputs()
+        return [
             dev for dev in all_outputs
             if any(kw in dev.description().lower() for kw in self.VIRTUAL_DEVICE_KEYWORDS)
         ]
-        if not virtual_devices:
-            QMessageBox.warning(
-                None,
-                "No virtual audio devices found",
-                "No virtual mic / virtual cable output devices were detected.\n\n"
-                "Install something like VB-Audio Virtual Cable or Voicemeeter, "
-                "then restart SoundBox."
-            )
-        return virtual_devices
+
+    @staticmethod
+    def warn_no_virtual_devices() -> None:
+        QMessageBox.warning(
+            None,
+            "No virtual audio devices found",
+            "No virtual mic / virtual cable output devices were detected.\n\n"
+            "Install something like VB-Audio Virtual Cable or Voicemeeter, "
+            "then restart SoundBox."
+        )
 
     def setup_default_audio_output(self) -> None:
         default_device = QMediaDevices.defaultAudioOutput()
         self.default_audio_output = QAudioOutput(default_device)
-        volume = int(os.environ.get("VolumeInput", "50")) / 100
-        self.default_audio_output.setVolume(volume)
+        self.default_audio_output.setVolume(self.volume / 100)
         self.player.setAudioOutput(self.default_audio_output)
 
     def setup_audio_input(self, device_name: str) -> None:
-        all_outputs = QMediaDevices.audioOutputs()
-        selected_device = next(
-            (dev for dev in all_outputs if dev.description() == device_name), None
-        )
-
-        self.current_input_device_name = ""
-        self.virtual_cable_output = None
+        selected_device = self.find_audio_output(device_name)
+
+        if selected_device is None:
+            self.current_input_device_name = ""
+            if self.virtual_cable_output is not None:
+                self.virtual_cable_player.stop()
+                self.virtual_cable_player.setSource(QUrl())
+                self.virtual_cable_player.setAudioOutput(None)
+                self.virtual_cable_output = None
+            return
 
-        if selected_device:
+        if self.virtual_cable_output is None:
             self.virtual_cable_output = QAudioOutput(device=selected_device)
-            self.current_input_device_name = device_name
-            volume = int(os.environ.get("VolumeInput", "50")) / 100
-            self.virtual_cable_output.setVolume(volume)
+            self.virtual_cable_output.setVolume(self.volume / 100)
             self.virtual_cable_player.setAudioOutput(self.virtual_cable_output)
+        else:
+            self.virtual_cable_output.setDevice(selected_device)
+        self.current_input_device_name = device_name
 
     def set_volume(self, volume_percent: int) -> None:
-        vol = max(0, min(100, int(volume_percent))) / 100
+        self.volume = max(0, min(100, int(volume_percent)))
+        vol = self.volume / 100
         if self.default_audio_output is not None:
             self.default_audio_output.setVolume(vol)
         if self.virtual_cable_output is not None:
             self.virtual_cable_output.setVolume(vol)
 
-    def refresh_sound_list_cache(self) -> None:
-        directory = os.environ.get("SOUNDBOARD_DIR")
-        self._sound_list_cache_dir = directory
+    @staticmethod
+    def scan_sound_directory(directory: Optional[str]) -> Tuple[List[str], Dict[str, str]]:
         if not directory or not os.path.exists(directory):
-            self._sound_list_cache = []
-            return
+            return [], {}
 
         try:
-            sound_files_set = set()
-            for file in os.listdir(directory):
-                if file.endswith(Config.SUPPORTED_FORMATS):
-                    full_path = os.path.join(directory, file)
-                    if os.path.exists(full_path):
-                        name = os.path.splitext(file)[0]
-                        sound_files_set.add(name)
-
-            sound_files = list(sound_files_set)
-            sound_files.sort(key=lambda x: max(
-                [os.path.getmtime(os.path.join(directory, x + ext))
-                 for ext in Config.SUPPORTED_FORMATS if os.path.exists(os.path.join(directory, x + ext))]
-            ) if any(os.path.exists(os.path.join(directory, x + ext)) for ext in Config.SUPPORTED_FORMATS) else 0,
-            reverse=True)
-            self._sound_list_cache = sound_files
+            entries_by_name: Dict[str, SoundEntry] = {}
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name, ext = os.path.splitext(entry.name)
+                    rank = FORMAT_RANKS.get(ext.lower())
+                    if rank is not None and entry.is_file():
+                        mtime = entry.stat().st_mtime
+                        sound = entries_by_name.get(name)
+                        if sound is None:
+                            entries_by_name[name] = SoundEntry(name, entry.path, mtime, rank)
+                            continue
+                        sound.mtime = max(sound.mtime, mtime)
+                        if rank < sound.rank:
+                            sound.path = entry.path
+                            sound.rank = rank
+
+            sounds = sorted(entries_by_name.values(), key=attrgetter('mtime'), reverse=True)
+            return [sound.name for sound in sounds], {sound.name: sound.path for sound in sounds}
         except Exception:
-            self._sound_list_cache = ["NO MUSIC WAS LOADED"]
+            return ["NO MUSIC WAS LOADED"], {}
 
-    def get_sound_list(self) -> List[str]:
-        directory = os.environ.get("SOUNDBOARD_DIR")
-        if directory != self._sound_list_cache_dir:
-            self.refresh_sound_list_cache()
-        return self._sound_list_cache
+    def apply_sound_scan(self, path_index: Dict[str, str]) -> None:
+        self._path_index = path_index
+        self._url_cache.clear()
 
-    def play_sound_file(self, sound_name: str) -> bool:
-        if self.default_audio_output is None:
-            self.setup_default_audio_output()
+    def invalidate_sound_cache(self) -> None:
+        self._path_index = {}
+        self._url_cache.clear()
 
+    def _find_sound_path(self, sound_name: str) -> str:
         sound_dir = os.environ.get("SOUNDBOARD_DIR", "")
-        sound_path = ""
         for ext in Config.SUPPORTED_FORMATS:
             temp_path = os.path.join(sound_dir, sound_name + ext)
             if os.path.exists(temp_path):
-                sound_path = temp_path
-                break
+                self._path_index[sound_name] = temp_path
+                return temp_path
+        return ""
 
-        if not sound_path:
-            return False
+    def play_sound_file(self, sound_name: str) -> bool:
+        if self.default_audio_output is None:
+            self.setup_default_audio_output()
 
-        url = QUrl.fromLocalFile(sound_path)
+        url = self._url_cache.get(sound_name)
+        if url is None:
+            sound_path = self._path_index.get(sound_name) or self._find_sound_path(sound_name)
+            if not sound_path:
+                return False
 
-        self.player.setSource(url)
-        self.player.play()
+            url = QUrl.fromLocalFile(sound_path)
+            self._url_cache[sound_name] = url
+
+        self._play_url(self.player, url)
 
         if self.virtual_cable_output is not None:
-            self.virtual_cable_player.setSource(url)
-            self.virtual_cable_player.play()
+            self._play_url(self.virtual_cable_player, url)
 
         return True
+
+    @staticmethod
+    def _play_url(player: QMediaPlayer, url: QUrl) -> None:
+        if player.source() == url:
+            player.setPosition(0)
+        else:
+            player.setSource(url)
+        player.play()
@@ -1,10 +1,11 @@
 import os
+from pathlib import Path
 class Config:
-    if not os.path.exists(os.getenv('APPDATA')+'\\Soundbox') :
-        os.mkdir(os.getenv('APPDATA')+'\\Soundbox')
-    KEYBINDS_FILE = os.getenv('APPDATA') + '\\Soundbox\\keybinds.json'
-    SETTINGS_FILE = os.getenv('APPDATA') + '\\Soundbox\\settings.json'
-    LOG_FILE = os.getenv('APPDATA') + '\\Soundbox\\log.txt'
+    APP_DATA_DIR = Path(os.environ['APPDATA']) / 'Soundbox'
+    APP_DATA_DIR.mkdir(exist_ok=True)
+    KEYBINDS_FILE = str(APP_DATA_DIR / 'keybinds.json')
+    SETTINGS_FILE = str(APP_DATA_DIR / 'settings.json')
+    LOG_FILE = str(APP_DATA_DIR / 'log.txt')
 
     DEFAULT_SETTINGS = {
         "Directory": "",
@@ -1,12 +1,14 @@
 import json
-from typing import Dict , Optional
+from typing import Dict , FrozenSet , Optional
 import os
 class HotkeyConfig:
     
-    def __init__(self, config_file: str):
+    def __init__(self, config_file: str, autoload: bool = True):
         self.config_file = config_file
         self.hotkeys: Dict[str, str] = {}
-        self.load_config()
+        self._chord_index: Dict[FrozenSet[str], str] = {}
+        if autoload:
+            self.load_config()
     
     def load_config(self):
         if os.path.exists(self.config_file):
@@ -17,22 +19,54 @@ class HotkeyConfig:
                 self.hotkeys = {}
         else:
             self.hotkeys = {}
+        self._rebuild_index()
+    
+    @staticmethod
+    def _combo_to_chord(key_combination: str) -> FrozenSet[str]:
+        split_at = key_combination.find('+', 1)
+        if 0 < split_at < len(key_combination) - 1:
+            return frozenset((key_combination[:split_at], key_combination[split_at + 1:]))
+        return frozenset((key_combination,))
+    
+    def _rebuild_index(self):
+        self._chord_index = {self._combo_to_chord(combo): action
+                             for combo, action in self.hotkeys.items()}
     
     def save_config(self):
-        with open(self.config_file, 'w') as f:
+        temp_file = self.config_file + '.tmp'
+        with open(temp_file, 'w') as f:
             json.dump(self.hotkeys, indent=4, fp=f)
+        os.replace(temp_file, self.config_file)
     
     def add_hotkey(self, action_name: str, key_combination: str):
-        self.hotkeys[key_combination] = action_name
+        self._bind(action_name, key_combination)
         self.save_config()
     
     def remove_hotkey(self, key_combination: str):
         if key_combination in self.hotkeys:
-            del self.hotkeys[key_combination]
+            self._unbind(key_combination)
             self.save_config()
     
-    def get_action(self, key_combination: str) -> Optional[str]:
-        return self.hotkeys.get(key_combination)
+    def set_hotkey(self, action_name: str, key_combination: Optional[str]):
+        old_combos = [c for c, a in self.hotkeys.items() if a == action_name]
+        if old_combos == ([key_combination] if key_combination else []):
+            return
+        for combo in old_combos:
+            self._unbind(combo)
+        if key_combination:
+            self._bind(action_name, key_combination)
+        self.save_config()
+    
+    def _bind(self, action_name: str, key_combination: str):
+        self.hotkeys[key_combination] = action_name
+        self._chord_index[self._combo_to_chord(key_combination)] = action_name
+    
+    def _unbind(self, key_combination: str):
+        del self.hotkeys[key_combination]
+        self._chord_index.pop(self._combo_to_chord(key_combination), None)
+    
+    def get_action_for_keys(self, keys: FrozenSet[str]) -> Optional[str]:
+        return self._chord_index.get(keys)
     
     def get_hotkey_for_action(self, action_name: str) -> Optional[str]:
         for combo, action in self.hotkeys.items():
@@ -33,10 +33,10 @@ class HotkeyListenerThread(QThread):
     
     def _on_press(self, key):
         key_name = self._normalize_key(key)
-        if not key_name:
+        if not key_name or key_name in self.current_keys:
             return
         if self.capture_mode:
-            if key_name not in self.current_keys and len(self.current_keys) < 2:
+            if len(self.current_keys) < 2:
                 self.current_keys.add(key_name)
                 combo = '+'.join(sorted(self.current_keys))
                 self.key_captured.emit(combo)
@@ -44,13 +44,13 @@ class HotkeyListenerThread(QThread):
         
         if len(self.current_keys) < 2:
             self.current_keys.add(key_name)
-            combo = '+'.join(sorted(self.current_keys))
-            action_name = self.config.get_action(combo)
+            chord = frozenset(self.current_keys)
+            action_name = self.config.get_action_for_keys(chord)
             
             if action_name:
-                if not self._last_executed or self._last_executed != combo:
+                if self._last_executed != chord:
                     self.action_triggered.emit(action_name)
-                    self._last_executed = combo
+                    self._last_executed = chord
     
     def _on_release(self, key):
         if self.capture_mode:
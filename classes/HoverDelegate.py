@@ -2,17 +2,22 @@ from PySide6.QtWidgets import (QStyledItemDelegate , QStyle,QStyleOptionButton ,
 from PySide6.QtCore import (Signal , QModelIndex ,  QEvent , Qt , QRect)
 class HoverDelegate(QStyledItemDelegate):
     buttonClicked = Signal(QModelIndex)
+    BUTTON_WIDTH, BUTTON_HEIGHT = 80, 25
+    BUTTON_RIGHT_OFFSET = BUTTON_WIDTH + 5
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._button_option = QStyleOptionButton()
+        self._button_option.text = "Set Key"
+        self._button_option.state = QStyle.State_Enabled | QStyle.State_Raised
+        self._style = QApplication.style()
 
     def paint(self, painter, option, index):
         super().paint(painter, option, index)
         
         if option.state & QStyle.State_MouseOver:
-            button_option = QStyleOptionButton()
-            button_option.rect = self._get_button_rect(option)
-            button_option.text = "Set Key"
-            
-            button_option.state = QStyle.State_Enabled | QStyle.State_Raised
-            QApplication.style().drawControl(QStyle.CE_PushButton, button_option, painter)
+            self._button_option.rect = self._get_button_rect(option)
+            self._style.drawControl(QStyle.CE_PushButton, self._button_option, painter)
 
     def editorEvent(self, event, model, option, index):
         if (event.type() == QEvent.MouseButtonRelease and 
@@ -23,10 +28,10 @@ class HoverDelegate(QStyledItemDelegate):
         return super().editorEvent(event, model, option, index)
 
     def _get_button_rect(self, option) -> QRect:
-        button_width, button_height = 80, 25
+        rect = option.rect
         return QRect(
-            option.rect.right() - button_width - 5,
-            option.rect.top() + (option.rect.height() - button_height) // 2,
-            button_width,
-            button_height
+            rect.right() - self.BUTTON_RIGHT_OFFSET,
+            rect.top() + (rect.height() - self.BUTTON_HEIGHT) // 2,
+            self.BUTTON_WIDTH,
+            self.BUTTON_HEIGHT
         )
\ No newline at end of file
@@ -2,13 +2,20 @@
 import json
 from typing import Dict , Any
 import os
+from PySide6.QtCore import QTimer
 from classes.Config import Config
 
 class SettingsManager:
     
+    SAVE_DELAY_MS = 250
+
     def __init__(self):
         self.settings = self._load_settings()
-        
+        self._dirty = False
+        self._save_timer = QTimer()
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(self.SAVE_DELAY_MS)
+        self._save_timer.timeout.connect(self.flush)
     
     def _load_settings(self) -> Dict[str, Any]:
         
@@ -22,21 +29,29 @@ class SettingsManager:
     
     def _save_settings(self, settings: Dict[str, Any]) -> None:
         
-        with open(Config.SETTINGS_FILE, "w") as f:
+        temp_file = Config.SETTINGS_FILE + ".tmp"
+        with open(temp_file, "w") as f:
             json.dump(settings, f, indent=4)
+        os.replace(temp_file, Config.SETTINGS_FILE)
     
     def get(self, key: str, default=None):
         return self.settings.get(key, default)
     
     def set(self, key: str, value: Any) -> None:
         self.settings[key] = value
-        self._save_settings(self.settings)
+        self._dirty = True
+        self._save_timer.start()
+
+    def flush(self) -> None:
+        self._save_timer.stop()
+        if self._dirty:
+            self._save_settings(self.settings)
+            self._dirty = False
 
     def update_environment_variables(self) -> None:
         env_mappings = {
             "Directory": "SOUNDBOARD_DIR",
-            "DefaultInput": "DefaultInput",
-            "VolumeInput": "VolumeInput"
+            "DefaultInput": "DefaultInput"
         }
         
         for setting_key, env_key in env_mappings.items():
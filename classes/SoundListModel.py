@@ -0,0 +1,62 @@
+from PySide6.QtCore import (QAbstractListModel , QModelIndex , Qt)
+from typing import List, Tuple
+
+class SoundListModel(QAbstractListModel):
+
+    MAX_INCREMENTAL_CHANGES = 32
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._items: List[str] = []
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._items)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            return self._items[index.row()]
+        return None
+
+    def update(self, new_items: List[str]) -> None:
+        new_items = list(new_items)
+        old_set = set(self._items)
+        new_set = set(new_items)
+        kept = [item for item in self._items if item in new_set]
+        if kept != [item for item in new_items if item in old_set]:
+            self._reset(new_items)
+            return
+
+        removed_groups = self._group_rows(
+            [row for row, item in enumerate(self._items) if item not in new_set])
+        added_groups = self._group_rows(
+            [row for row, item in enumerate(new_items) if item not in old_set])
+        if len(removed_groups) + len(added_groups) > self.MAX_INCREMENTAL_CHANGES:
+            self._reset(new_items)
+            return
+
+        for first, last in reversed(removed_groups):
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self._items[first:last + 1]
+            self.endRemoveRows()
+
+        for first, last in added_groups:
+            self.beginInsertRows(QModelIndex(), first, last)
+            self._items[first:first] = new_items[first:last + 1]
+            self.endInsertRows()
+
+    def _reset(self, new_items: List[str]) -> None:
+        self.beginResetModel()
+        self._items = new_items
+        self.endResetModel()
+
+    @staticmethod
+    def _group_rows(rows: List[int]) -> List[Tuple[int, int]]:
+        groups = []
+        for row in rows:
+            if groups and groups[-1][1] == row - 1:
+                groups[-1] = (groups[-1][0], row)
+            else:
+                groups.append((row, row))
+        return groups
@@ -0,0 +1,19 @@
+from PySide6.QtCore import (QObject , QRunnable , Signal)
+from typing import Optional
+from classes.AudioManager import AudioManager
+
+class SoundScanSignals(QObject):
+
+    results_ready = Signal(int, list, dict)
+
+class SoundScanTask(QRunnable):
+
+    def __init__(self, directory: Optional[str], generation: int):
+        super().__init__()
+        self.directory = directory or ""
+        self.generation = generation
+        self.signals = SoundScanSignals()
+
+    def run(self):
+        sound_files, path_index = AudioManager.scan_sound_directory(self.directory)
+        self.signals.results_ready.emit(self.generation, sound_files, path_index)
@@ -1,12 +1,13 @@
 import sys
 import os
 import json
-import re
+import functools
+from typing import Dict, List
 from PySide6 import QtCore, QtWidgets, QtGui
-from PySide6.QtCore import Qt, QSize, Slot, QModelIndex, QMetaObject, QStringListModel
+from PySide6.QtCore import Qt, QSize, Slot, QModelIndex, QMetaObject, QThreadPool, QSortFilterProxyModel
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                                QListView, QPushButton, QSlider, QLabel, QComboBox,
-                               QMessageBox, QFileDialog, QAbstractItemView, QTextEdit)
+                               QMessageBox, QFileDialog, QAbstractItemView, QLineEdit)
 from PySide6.QtGui import QIcon, QFont
 from PySide6.QtMultimedia import QMediaPlayer
 from pyqt_loading_button import LoadingButton, AnimationType
@@ -21,11 +22,18 @@ from classes.HotkeyConfig import HotkeyConfig
 from classes.HoverDelegate import HoverDelegate
 from classes.HotkeyListenerThread import HotkeyListenerThread
 from classes.KeybindDialog import KeybindDialog
+from classes.SoundListModel import SoundListModel
+from classes.SoundScanTask import SoundScanTask
 
 os.environ["QT_LOGGING_RULES"] = "*.ffmpeg.*=false"
 class ResourceManager:
     
+    _icon_cache: Dict[str, QIcon] = {}
+    PRELOADED_ICONS = ("play.png", "pause.png", "stop.webp", "reload.png",
+                       "stop_keybind.png", "window_icon.png")
+
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def get_resource_path(relative_path: str) -> str:
         try:
             base_path = sys._MEIPASS
@@ -33,9 +41,24 @@ class ResourceManager:
             base_path = os.path.abspath("./resources")
         return os.path.join(base_path, relative_path)
 
+    @classmethod
+    def get_icon(cls, name: str) -> QIcon:
+        icon = cls._icon_cache.get(name)
+        if icon is None:
+            icon = QIcon(cls.get_resource_path(name))
+            cls._icon_cache[name] = icon
+        return icon
+
+    @classmethod
+    def preload_icons(cls) -> None:
+        for name in cls.PRELOADED_ICONS:
+            cls.get_icon(name)
+
 
 class SoundboardWindow(QMainWindow):
     
+    SEEK_SLIDER_STEP_MS = 200
+
     def __init__(self):
         super().__init__()
         self.old_pos = None
@@ -45,20 +68,23 @@ class SoundboardWindow(QMainWindow):
         self.maximum_size = QSize(1200, 800)
         self.settings_manager = SettingsManager()
         self.audio_manager = AudioManager(self.settings_manager)
-        self.hotkey_config = HotkeyConfig(Config.KEYBINDS_FILE)
+        self.hotkey_config = HotkeyConfig(Config.KEYBINDS_FILE, autoload=False)
         self.hotkey_listener = None
         self.current_capture_action = None
+        self._scan_task = None
+        self._scan_generation = 0
 
+        ResourceManager.preload_icons()
+        self._icon_play = ResourceManager.get_icon("play.png")
+        self._icon_pause = ResourceManager.get_icon("pause.png")
         self._setup_window()
         self._create_widgets()
         self._setup_layouts()
         self._connect_signals()
         self._initialize_audio()
-        self._load_sounds()
         self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
         self.setAttribute(Qt.WA_TranslucentBackground)
         self.setWindowModality(QtCore.Qt.ApplicationModal)
-        self.setMouseTracking(True)
         self.setStyleSheet("""
                            QWidget{
                            background: qlineargradient(x1:0 y1:0, x2:1 y2:1, stop:0 #051c2a stop:1 #44315f);
@@ -105,6 +131,17 @@ class SoundboardWindow(QMainWindow):
                             background: transparent;
                             color: white;
                            }
+                           QLabel#controlLabel{
+                            padding-bottom: 5px;
+                           }
+                           QLabel#nowPlaying[playing="true"]{
+                            color: green;
+                           }
+                           QSlider{
+                            border: 0px;
+                            background: transparent;
+                           }
+                           QPushButton#selectFolderBtn{""" + Stylesheets.get_button_style() + """}
                            QListView{
                             background: transparent;
                             padding-right: 2px;
@@ -126,7 +163,7 @@ class SoundboardWindow(QMainWindow):
                             QListView:focus{
                             outline: None;
                             }
-                            QTextEdit{
+                            QLineEdit{
                             color: white;
                             background: grey;
                             border-radius: 5px;
@@ -136,9 +173,14 @@ class SoundboardWindow(QMainWindow):
 
         self.minimize_animation = None
 
-        QMetaObject.invokeMethod(
-            self, "_start_hotkey_listener", Qt.QueuedConnection)
-        
+        QtCore.QTimer.singleShot(0, self._deferred_startup)
+
+    @Slot()
+    def _deferred_startup(self) -> None:
+        self._load_sounds()
+        self.hotkey_config.load_config()
+        self._start_hotkey_listener()
+
     @Slot()
     def _start_hotkey_listener(self):
         self.hotkey_listener = HotkeyListenerThread(self.hotkey_config)
@@ -165,7 +207,7 @@ class SoundboardWindow(QMainWindow):
 
     def _setup_window(self) -> None:
         self.setWindowTitle("SoundBox")
-        self.setWindowIcon(QIcon(ResourceManager.get_resource_path("window_icon.png")))
+        self.setWindowIcon(ResourceManager.get_icon("window_icon.png"))
         self.setMinimumSize(self.minimum_size)
         self.setMaximumSize(self.maximum_size)
 
@@ -187,9 +229,11 @@ class SoundboardWindow(QMainWindow):
         self._create_start_end_labels()
 
     def _create_seek_slider(self) -> None:
+        self._last_slider_position = 0
+        self._last_position_seconds = -1
+        self._slider_held = False
         self.seek_slider = QSlider(Qt.Horizontal)
         self.seek_slider.setValue(0)
-        self.seek_slider.setStyleSheet("border: 0px;background: transparent;")
         self.seek_slider.setCursor(Qt.PointingHandCursor)
         self.seek_slider.setFocusPolicy(Qt.NoFocus)
         self.seek_slider.setDisabled(True)
@@ -197,11 +241,9 @@ class SoundboardWindow(QMainWindow):
     def _create_start_end_labels(self) -> None:
         self.start_label = QLabel("00:00")
         self.start_label.setFont(QFont("Arial", 10))
-        self.start_label.setStyleSheet("border: none;background: transparent;")
         
         self.end_label = QLabel("00:00")
         self.end_label.setFont(QFont("Arial", 10))
-        self.end_label.setStyleSheet("border: none;background: transparent;")
 
     def _create_media_buttons(self) -> None:
         self.play_button = self._create_icon_button("play.png", (70, 50), (50, 50))
@@ -221,28 +263,30 @@ class SoundboardWindow(QMainWindow):
     def _create_audio_device_widgets(self) -> None:
         self.audio_input_devices = QComboBox()
         self.audio_input_devices.setObjectName("audio_input_devices")
-        input_devices = [dev.description() for dev in self.audio_manager.get_audio_input_devices()]
-        self.audio_input_devices.addItems(input_devices)
-        self.audio_input_devices.setCurrentText(self.settings_manager.get("DefaultInput", ""))
+        if not self._populate_audio_devices(self.settings_manager.get("DefaultInput", "")):
+            self.audio_manager.warn_no_virtual_devices()
         self.input_device_label = self._create_label("Select Virtual Cable / Mic Output", 12)
 
     def _create_sound_list_widget(self) -> None:
         self.list_view = QListView()
-        self.model = QStringListModel()
+        self.source_model = SoundListModel()
+        self.model = QSortFilterProxyModel()
+        self.model.setSourceModel(self.source_model)
+        self.model.setFilterCaseSensitivity(Qt.CaseInsensitive)
         self.list_view.setModel(self.model)
         self.list_view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.list_view.setSelectionMode(QAbstractItemView.SingleSelection)
         self.list_view.setMouseTracking(True)
         self.list_view.setSpacing(2)
         self.list_view.setUniformItemSizes(True)
+        self.list_view.setLayoutMode(QListView.Batched)
+        self.list_view.setBatchSize(100)
         self.list_view.setViewMode(QListView.ListMode)
         self.list_view.setResizeMode(QListView.Adjust)
         self.list_view.setWrapping(False)
         self.list_view.setIconSize(QSize(100, 40))
         self.list_view.setFont(QFont("Arial", 13))
         self.list_view.setStyleSheet(Stylesheets.get_scrollbar_style())
-        self.list_view.setAutoFillBackground(True)
-        self.list_view.viewport().setAutoFillBackground(True)
 
         self.hover_delegate = HoverDelegate(self)
         self.list_view.setItemDelegate(self.hover_delegate)
@@ -250,13 +294,17 @@ class SoundboardWindow(QMainWindow):
     def _create_other_widgets(self) -> None:
         self.now_playing = QLabel("Now Playing: None")
         self.now_playing.setFont(QFont("Arial", 12))
-        self.now_playing.setStyleSheet("border: none;background: transparent;")
+        self.now_playing.setObjectName("nowPlaying")
 
-        self.search_box = QTextEdit()
+        self.search_box = QLineEdit()
         self.search_box.setPlaceholderText("Search...")
         self.search_box.setFixedHeight(25)
         self.search_box.setFixedWidth(150)
 
+        self._filter_timer = QtCore.QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+
         self.select_folder_btn = LoadingButton(self)
         self.select_folder_btn.setText("Select Sound Folder")
         self.select_folder_btn.setAnimationType(AnimationType.Circle)
@@ -264,14 +312,13 @@ class SoundboardWindow(QMainWindow):
         self.select_folder_btn.setAnimationColor(QtGui.QColor(0, 0, 0))
         self.select_folder_btn.setAnimationWidth(15)
         self.select_folder_btn.setAnimationStrokeWidth(3)
-        self.select_folder_btn.setStyleSheet(Stylesheets.get_button_style())
+        self.select_folder_btn.setObjectName("selectFolderBtn")
 
     def _create_icon_button(self, icon_file: str, size: tuple, icon_size: tuple = None) -> QPushButton:
         button = QPushButton()
-        button.setIcon(QIcon(ResourceManager.get_resource_path(icon_file)))
+        button.setIcon(ResourceManager.get_icon(icon_file))
         if icon_size:
             button.setIconSize(QSize(*icon_size))
-        button.setStyleSheet("QPushbutton{background-color: transparent;border: 0px;}")
         button.setFlat(True)
         button.setCursor(Qt.PointingHandCursor)
         button.setFixedSize(*size)
@@ -283,7 +330,7 @@ class SoundboardWindow(QMainWindow):
         font = QFont()
         font.setPointSize(font_size)
         label.setFont(font)
-        label.setStyleSheet("padding-bottom: 5px; border: transparent; background: transparent; color: white;")
+        label.setObjectName("controlLabel")
         return label
     
     def _create_volume_slider(self, env_var: str) -> QSlider:
@@ -292,15 +339,11 @@ class SoundboardWindow(QMainWindow):
         slider.setMaximum(100)
         slider.setMinimum(0)
         slider.setValue(int(self.settings_manager.get(env_var)))
-        slider.setStyleSheet("border: 0px;background: transparent;")
         return slider
     
     def _setup_layouts(self) -> None:
         main_layout = QVBoxLayout(self.central_widget)
         main_layout.setContentsMargins(0, 0, 0, 0)
-        for widget in self.central_widget.children():
-            if isinstance(widget, QLabel) or isinstance(widget, QPushButton):
-                widget.setStyleSheet("background: transparent;")
 
         title_bar = QHBoxLayout()
         title_bar.setSpacing(0)
@@ -361,6 +404,7 @@ class SoundboardWindow(QMainWindow):
         self.play_button.clicked.connect(self.play_sound)
         self.stop_button.clicked.connect(self.stop_sound)
         self.audio_input_devices.currentTextChanged.connect(self._change_input_device)
+        self.audio_manager.media_devices.audioOutputsChanged.connect(self._refresh_audio_devices)
         self.volume_slider_input.valueChanged.connect(self._update_volume)
         self.list_view.doubleClicked.connect(self.stop_sound)
         self.list_view.doubleClicked.connect(self.play_sound)
@@ -369,35 +413,49 @@ class SoundboardWindow(QMainWindow):
 
         self.select_folder_btn.setAction(lambda: QMetaObject.invokeMethod(
             self, "_select_folder", Qt.QueuedConnection))
-        self.search_box.textChanged.connect(self._filter_sound_list)
+        self.search_box.textChanged.connect(self._filter_timer.start)
+        self._filter_timer.timeout.connect(self._filter_sound_list)
         self.reload_button.clicked.connect(self.reload_list)
         self.audio_manager.player.tracksChanged.connect(self._reset_slider)
         self.audio_manager.player.positionChanged.connect(self._set_seek_slider_value)
         self.audio_manager.player.playbackStateChanged.connect(self._on_playback_state_changed)
-        self.seek_slider.sliderPressed.connect(self._disconnect_slider)
+        self.seek_slider.sliderPressed.connect(self._hold_slider)
         self.seek_slider.sliderReleased.connect(self._set_players_index)
 
+    @Slot()
     def _reset_slider(self) -> None:
         self.seek_slider.setMaximum(self.audio_manager.player.duration())
-        self.end_label.setText(self.ms_to_hms(str(self.audio_manager.player.duration())))
+        self.end_label.setText(self.ms_to_hms(self.audio_manager.player.duration()))
         self.seek_slider.setValue(0)
+        self._last_slider_position = 0
+        self._last_position_seconds = -1
 
-    def _disconnect_slider(self) -> None:
-        self.audio_manager.player.positionChanged.disconnect(self._set_seek_slider_value)
+    @Slot()
+    def _hold_slider(self) -> None:
+        self._slider_held = True
 
-    def _set_seek_slider_value(self) -> None:
-        self.start_label.setText(self.ms_to_hms(str(self.audio_manager.player.position())))
-        self.seek_slider.setValue(self.audio_manager.player.position())
+    @Slot("qlonglong")
+    def _set_seek_slider_value(self, position: int) -> None:
+        if self._slider_held:
+            return
+        seconds = position // 1000
+        if seconds != self._last_position_seconds:
+            self._last_position_seconds = seconds
+            self.start_label.setText(self.ms_to_hms(position))
+        if abs(position - self._last_slider_position) >= self.SEEK_SLIDER_STEP_MS:
+            self._last_slider_position = position
+            self.seek_slider.setValue(position)
 
+    @Slot()
     def _set_players_index(self) -> None:
         pos = self.seek_slider.value()
         self.audio_manager.player.setPosition(pos)
         if self.audio_manager.virtual_cable_output is not None:
             self.audio_manager.virtual_cable_player.setPosition(pos)
-        self.audio_manager.player.positionChanged.connect(self._set_seek_slider_value)
+        self._last_slider_position = pos
+        self._slider_held = False
 
-    def ms_to_hms(self, ms_str):
-        ms = int(re.match(r'^(\d+)$', ms_str).group(1))
+    def ms_to_hms(self, ms: int) -> str:
         minutes = (ms // (1000 * 60)) % 60
         seconds = (ms // 1000) % 60
         return f"{minutes:02d}:{seconds:02d}"
@@ -406,39 +464,72 @@ class SoundboardWindow(QMainWindow):
         self.settings_manager.update_environment_variables()
         self.audio_manager.setup_default_audio_output()
         self._change_input_device()
-        self.audio_manager.set_volume(int(self.settings_manager.get("VolumeInput", 50)))
     
     def _load_sounds(self) -> None:
-        sound_list = self.audio_manager.get_sound_list()
-        self.model.setStringList(sound_list)
+        self._scan_generation += 1
+        self._scan_task = SoundScanTask(os.environ.get("SOUNDBOARD_DIR"), self._scan_generation)
+        self._scan_task.signals.results_ready.connect(self._on_sounds_scanned)
+        QThreadPool.globalInstance().start(self._scan_task)
+
+    @Slot(int, list, dict)
+    def _on_sounds_scanned(self, generation: int, sound_files: list, path_index: dict) -> None:
+        if generation != self._scan_generation:
+            return
+        self.audio_manager.apply_sound_scan(path_index)
+        self.source_model.update(sound_files)
     
-    def _update_volume(self) -> None:
-        if self.sender() == self.volume_slider_input:
-            input_volume = self.volume_slider_input.value()
-            self.settings_manager.set("VolumeInput", input_volume)
-            os.environ["VolumeInput"] = str(input_volume)
-            self.volume_input_slider_value.setText(str(input_volume))
-            self.audio_manager.set_volume(input_volume)
+    @Slot(int)
+    def _update_volume(self, input_volume: int) -> None:
+        if input_volume == self.audio_manager.volume:
+            return
+        self.settings_manager.set("VolumeInput", input_volume)
+        self.volume_input_slider_value.setText(str(input_volume))
+        self.audio_manager.set_volume(input_volume)
     
+    def _populate_audio_devices(self, selected_device: str) -> List[str]:
+        device_names = [dev.description() for dev in self.audio_manager.get_audio_input_devices()]
+        self.audio_input_devices.blockSignals(True)
+        self.audio_input_devices.clear()
+        self.audio_input_devices.addItems(device_names)
+        self.audio_input_devices.setCurrentText(selected_device)
+        self.audio_input_devices.blockSignals(False)
+        return device_names
+
+    @Slot()
+    def _refresh_audio_devices(self) -> None:
+        self.audio_manager.invalidate_audio_outputs()
+        current_device = self.audio_manager.current_input_device_name
+        saved_device = self.settings_manager.get("DefaultInput", "")
+        device_names = self._populate_audio_devices(saved_device)
+        if saved_device in device_names and current_device != saved_device:
+            self.audio_manager.setup_audio_input(saved_device)
+            return
+        if current_device in device_names:
+            self.audio_input_devices.blockSignals(True)
+            self.audio_input_devices.setCurrentText(current_device)
+            self.audio_input_devices.blockSignals(False)
+            return
+        self.audio_manager.setup_audio_input(self.audio_input_devices.currentText())
+
+    @Slot()
     def _change_input_device(self) -> None:
         device_name = self.audio_input_devices.currentText()
         self.audio_manager.setup_audio_input(device_name)
         self.settings_manager.set("DefaultInput", device_name)
-        self.audio_manager.set_volume(int(self.settings_manager.get("VolumeInput", 50)))
 
     @Slot()
     def _select_folder(self) -> None:
-        self.select_folder_btn.isRunning = True
-        self.select_folder_btn.update()
         selected_directory = QFileDialog.getExistingDirectory(
-            self, "Select Audio Directory")
+            self, "Select Audio Directory",
+            options=QFileDialog.Option.ShowDirsOnly
+            | QFileDialog.Option.DontResolveSymlinks
+            | QFileDialog.Option.DontUseCustomDirectoryIcons)
         
         if selected_directory:
             os.environ["SOUNDBOARD_DIR"] = selected_directory
             self.settings_manager.set("Directory", selected_directory)
+            self.audio_manager.invalidate_sound_cache()
             self._load_sounds()
-        self.select_folder_btn.isRunning = False
-        self.select_folder_btn.update()
 
     @Slot(QModelIndex)
     def _on_keybind_button_clicked(self, index: QModelIndex) -> None:
@@ -458,31 +549,20 @@ class SoundboardWindow(QMainWindow):
         self.hotkey_listener.stop_capture_mode()
         if result == QtWidgets.QDialog.Accepted:
             new_combo = self.keybind_dialog.get_keybind()
-            if new_combo is None:
-                old_combo = self.hotkey_config.get_hotkey_for_action(action_name)
-                self.hotkey_config.remove_hotkey(old_combo)
-            if new_combo:
-                old_combo = self.hotkey_config.get_hotkey_for_action(action_name)
-                if old_combo:
-                    self.hotkey_config.remove_hotkey(old_combo)
-                self.hotkey_config.add_hotkey(action_name, new_combo)
+            # None means the binding was cleared; "" means nothing was captured.
+            if new_combo != "":
+                self.hotkey_config.set_hotkey(action_name, new_combo)
 
         self.keybind_dialog = None
         self.current_capture_action = None
 
+    @Slot()
     def _filter_sound_list(self) -> None:
-        filter_text = self.search_box.toPlainText().lower()
-        all_sounds = self.audio_manager.get_sound_list()
-        
-        if filter_text:
-            filtered_sounds = [sound for sound in all_sounds if filter_text in sound.lower()]
-        else:
-            filtered_sounds = all_sounds
-        
-        self.model.setStringList(filtered_sounds)
+        self.model.setFilterFixedString(self.search_box.text())
 
+    @Slot()
     def reload_list(self) -> None:
-        self.audio_manager.refresh_sound_list_cache()
+        self.audio_manager.invalidate_sound_cache()
         self._load_sounds()
 
     def closeEvent(self, event):
@@ -491,19 +571,27 @@ class SoundboardWindow(QMainWindow):
             self.hotkey_listener.wait()
         event.accept()
 
-    def _on_playback_state_changed(self, state) -> None:
+    @Slot(QMediaPlayer.PlaybackState)
+    def _on_playback_state_changed(self, state: QMediaPlayer.PlaybackState) -> None:
         if state == QMediaPlayer.PlaybackState.StoppedState:
-            self.now_playing.setText("Now Playing: None")
-            self.now_playing.setStyleSheet("color: white; border: None;background: transparent;")
-            self.play_button.setIcon(QIcon(ResourceManager.get_resource_path("play.png")))
+            self._set_now_playing("None", False)
+            self.play_button.setIcon(self._icon_play)
             self.seek_slider.setDisabled(True)
         elif state == QMediaPlayer.PlaybackState.PausedState:
-            self.play_button.setIcon(QIcon(ResourceManager.get_resource_path("play.png")))
+            self.play_button.setIcon(self._icon_play)
             self.seek_slider.setEnabled(True)
         elif state == QMediaPlayer.PlaybackState.PlayingState:
-            self.play_button.setIcon(QIcon(ResourceManager.get_resource_path("pause.png")))
+            self.play_button.setIcon(self._icon_pause)
+            self.end_label.setText(self.ms_to_hms(self.audio_manager.player.duration()))
             self.seek_slider.setEnabled(True)
     
+    def _set_now_playing(self, sound_name: str, playing: bool) -> None:
+        self.now_playing.setText(f"Now Playing: {sound_name}")
+        if self.now_playing.property("playing") != playing:
+            self.now_playing.setProperty("playing", playing)
+            self.now_playing.style().unpolish(self.now_playing)
+            self.now_playing.style().polish(self.now_playing)
+
     def _toggle_maximize(self) -> None:
         current_state = self.windowState() 
         if current_state & Qt.WindowMaximized:
@@ -513,6 +601,7 @@ class SoundboardWindow(QMainWindow):
             self.showMaximized()
             self.overrideWindowState(Qt.WindowMaximized)
             
+    @Slot()
     def play_sound(self) -> None:
         current_state = self.audio_manager.player.playbackState()
         
@@ -521,8 +610,7 @@ class SoundboardWindow(QMainWindow):
             if selected_item.isValid():
                 sound_name = self.model.data(selected_item, Qt.DisplayRole)
                 if self._play_sound_by_name(sound_name):
-                    self.now_playing.setText(f"Now Playing: {sound_name}")
-                    self.now_playing.setStyleSheet("color: green; border: None;background: transparent;")
+                    self._set_now_playing(sound_name, True)
                 else:
                     QMessageBox.warning(self, "Error", "Sound file not found.")
             else:
@@ -538,8 +626,7 @@ class SoundboardWindow(QMainWindow):
     def _play_sound_by_name(self, sound_name: str) -> bool:
         try:
             if self.audio_manager.play_sound_file(sound_name):
-                self.now_playing.setText(f"Now Playing: {sound_name}")
-                self.now_playing.setStyleSheet("color: green; border: None")
+                self._set_now_playing(sound_name, True)
                 return True
             else:
                 if sound_name:
@@ -554,6 +641,7 @@ class SoundboardWindow(QMainWindow):
             if self.audio_manager.virtual_cable_output is not None:
                 self.audio_manager.virtual_cable_player.pause()
     
+    @Slot()
     def stop_sound(self) -> None:
         current_state = self.audio_manager.player.playbackState()
         if current_state in [QMediaPlayer.PlaybackState.PlayingState, 
@@ -572,10 +660,11 @@ class SoundboardApplication:
     def __init__(self):
         app.setApplicationName("SoundBox by BanditRN")
         app.setApplicationVersion("0.7.0")
-        app.setWindowIcon(QIcon(ResourceManager.get_resource_path("window_icon.png")))
+        app.setWindowIcon(ResourceManager.get_icon("window_icon.png"))
 
     def run(self) -> int:
         self.window = SoundboardWindow()
+        app.aboutToQuit.connect(self.window.settings_manager.flush)
         self.window.show()
         return app.exec()
     